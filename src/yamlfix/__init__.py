@@ -5,8 +5,35 @@ Functions:
     fix_files: Fix the yaml source code of a list of files.
 """
 
-from typing import List
+import sys
+from typing import TYPE_CHECKING, Any, List
 
-from yamlfix.services import fix_code, fix_files
+# Python 3.15+ (PEP 810) defers the import of these modules until their names are
+# first used, older interpreters fall back to the module __getattr__ below.
+__lazy_modules__: List[str] = ["yamlfix.services"]
+
+if TYPE_CHECKING or sys.version_info >= (3, 15):  # pragma: no cover
+    from yamlfix.services import fix_code, fix_files
 
 __all__: List[str] = ["fix_code", "fix_files"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the public functions on first access.
+
+    Importing yamlfix.services loads ruyaml, so delay it until the functions are
+    actually used instead of paying for it on `import yamlfix`.
+    """
+    if name in __all__:
+        from yamlfix import services  # pylint: disable=import-outside-toplevel
+
+        globals().update(
+            {"fix_code": services.fix_code, "fix_files": services.fix_files}
+        )
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(__all__))
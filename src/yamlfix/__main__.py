@@ -0,0 +1,30 @@
+"""Define the yamlfix console script.
+
+Functions:
+    main: Run the command line interface, loading it only when it's needed.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the yamlfix command line interface.
+
+    `yamlfix --version` is answered without importing click and ruyaml, the rest
+    of the invocations are handed to the click command.
+    """
+    if sys.argv[1:] == ["--version"]:
+        from yamlfix.version import (  # pylint: disable=import-outside-toplevel
+            version_info,
+        )
+
+        print(version_info())
+        return
+
+    from yamlfix.entrypoints.cli import cli  # pylint: disable=import-outside-toplevel
+
+    cli()  # pylint: disable=E1120
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
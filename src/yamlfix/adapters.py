@@ -15,6 +15,34 @@ from yamlfix.model import YamlfixConfig, YamlNodeStyle
 
 log = logging.getLogger(__name__)
 
+# Compile once the regular expressions the source code fixers run on each line
+_BOOLEAN_STRING_REGEX = re.compile(
+    r"(?P<pre_boolean_text>.*(:|-) )((?P<true>true|yes|on)|false|no|off)$",
+    re.IGNORECASE,
+)
+_TRUTHY_STRING_REGEX = re.compile(
+    r"(?P<pre_boolean_text>.*(:|-) )(?P<boolean_text>yes|on|no|off)$", re.IGNORECASE
+)
+# Endings a line needs for the truthy regular expressions to match it, checked first
+# as most lines don't end in a boolean
+_BOOLEAN_STRING_ENDINGS = (" true", " yes", " on", " false", " no", " off")
+_TRUTHY_STRING_ENDINGS = (" yes", " on", " no", " off")
+_FIRST_CONTENT_LINE_REGEX = re.compile(r"^(?!---$|#|$).*", re.MULTILINE)
+_LIST_ITEM_REGEX = re.compile(r"(?P<indent>\s*)- +(?P<content>.*)")
+_FLOW_STYLE_LIST_REGEX = re.compile(r"\[(?P<items>.*)(?P<newlines>\n+)]")
+_COMMENT_WITHOUT_SPACE_REGEX = re.compile(r"(^|\s)#\w")
+_INLINE_COMMENT_REGEX = re.compile(r"(.+\S)(\s+?)#")
+_WHITELINES_WITH_COMMENTS_REGEX = re.compile("\n\n+[\t ]{0,}[#]")
+_WHITELINES_WITHOUT_COMMENTS_REGEX = re.compile("\n\n+[\t ]{0,}[^#\n\t ]")
+
+_SECTION_REGEX = "\n*(^#.*\n)*\n*^[^ ].*:\n(\n|(^  .*))+\n*"
+# Match the first --- or start of the string \A
+# See: https://docs.python.org/3.9/library/re.html#regular-expression-syntax
+_SECTION_WHITELINES_REGEX = re.compile(
+    f"(?P<b>(?:---\n|\\A){_SECTION_REGEX})|(?P<s>{_SECTION_REGEX})",
+    flags=re.MULTILINE,
+)
+
 
 class Yaml:
     """Adapter that holds the configured ruaml yaml fixer."""
@@ -132,13 +160,14 @@ class YamlfixRepresenter(RoundTripRepresenter):
             call the provided patch_function on its mapping_values."""
         mapping_node: MappingNode = super().represent_mapping(tag, mapping, flow_style)
         mapping_values: List[Tuple[ScalarNode, Node]] = mapping_node.value
+        patch_functions = self.patch_functions
 
-        if isinstance(mapping_values, list):
+        if patch_functions and isinstance(mapping_values, list):
             for mapping_value in mapping_values:
                 if isinstance(mapping_value, tuple):
                     key_node: Node = mapping_value[0]
                     value_node: Node = mapping_value[1]
-                    for patch_function in self.patch_functions:
+                    for patch_function in patch_functions:
                         patch_function(key_node, value_node)
 
         return mapping_node
@@ -153,12 +182,16 @@ class YamlfixRepresenter(RoundTripRepresenter):
         config = self.config
         log.debug("Setting up ruamel yaml 'quote simple values' configuration...")
 
-        def patch_quotations(key_node: Node, value_node: Node) -> None:  # noqa: W0613
-            if not config.quote_basic_values or config.quote_representation is None:
-                return
+        # Don't register a patch function that would do nothing for every mapping value
+        if not config.quote_basic_values or config.quote_representation is None:
+            return
+
+        quote_representation: str = config.quote_representation
+        apply_quotations = self._apply_simple_value_quotations
 
+        def patch_quotations(key_node: Node, value_node: Node) -> None:  # noqa: W0613
             # if this is a scalar value node itself, apply the quotations now
-            self._apply_simple_value_quotations(value_node)
+            apply_quotations(value_node, quote_representation)
 
             # if this is a sequence value node, check for value presence, complex
             # sequences and apply quotations to its values
@@ -173,7 +206,7 @@ class YamlfixRepresenter(RoundTripRepresenter):
                 return
 
             for seq_value in sequence_node.value:
-                self._apply_simple_value_quotations(seq_value)
+                apply_quotations(seq_value, quote_representation)
 
         self.patch_functions.append(patch_quotations)
 
@@ -210,15 +243,17 @@ class YamlfixRepresenter(RoundTripRepresenter):
         config = self.config
         log.debug("Setting up ruamel yaml 'sequence flow style' configuration...")
 
+        # don't modify the sequence style at all, if the config value is set to
+        # `keep_style`
+        if config.sequence_style == YamlNodeStyle.KEEP_STYLE:
+            return
+
+        flow_style = config.sequence_style == YamlNodeStyle.FLOW_STYLE
+
         def patch_sequence_style(key_node: Node, value_node: Node) -> None:
             if isinstance(key_node, ScalarNode) and isinstance(
                 value_node, SequenceNode
             ):
-                # don't modify the sequence style at all, if the config value is
-                # set to `keep_style`
-                if config.sequence_style == YamlNodeStyle.KEEP_STYLE:
-                    return
-
                 force_block_style: bool = False
                 sequence_node: SequenceNode = value_node
 
@@ -248,11 +283,7 @@ class YamlfixRepresenter(RoundTripRepresenter):
                     or self._seq_length_longer_than_line_length(key_node, sequence_node)
                 )
 
-                sequence_node.flow_style = (
-                    config.sequence_style == YamlNodeStyle.FLOW_STYLE
-                )
-                if force_block_style:
-                    sequence_node.flow_style = False
+                sequence_node.flow_style = flow_style and not force_block_style
 
         self.patch_functions.append(patch_sequence_style)
 
@@ -262,16 +293,13 @@ class YamlfixRepresenter(RoundTripRepresenter):
 
     @staticmethod
     def _seq_contains_non_empty_comments(seq_node: Node) -> bool:
-        comment_tokens: List[CommentToken] = []
-
-        for node in seq_node.value:
-            if isinstance(node, ScalarNode) and isinstance(node.comment, list):
-                comment_tokens.extend(node.comment)
-
         return any(
             isinstance(comment_token, CommentToken)
-            and comment_token.value.strip() != ""
-            for comment_token in comment_tokens
+            and comment_token.value
+            and not comment_token.value.isspace()
+            for node in seq_node.value
+            if isinstance(node, ScalarNode) and isinstance(node.comment, list)
+            for comment_token in node.comment
         )
 
     def _seq_length_longer_than_line_length(
@@ -296,24 +324,29 @@ class YamlfixRepresenter(RoundTripRepresenter):
 
         key_length: int = len(str(key_node.value)) + quote_length + separator_length
 
-        scalar_length: int = 0
+        # Stop counting as soon as the scalars have used up the rest of the line
+        available_length: int = config.line_length - key_length - bracket_length
 
         for node in seq_node.value:
             if isinstance(node, ScalarNode):
-                scalar_length += len(str(node.value)) + quote_length + separator_length
-
-        if key_length + scalar_length + bracket_length > config.line_length:
-            return True
+                available_length -= (
+                    len(str(node.value)) + quote_length + separator_length
+                )
+                if available_length < 0:
+                    return True
 
-        return False
+        return available_length < 0
 
-    def _apply_simple_value_quotations(self, value_node: Node) -> None:
+    @staticmethod
+    def _apply_simple_value_quotations(
+        value_node: Node, quote_representation: str
+    ) -> None:
         if (
             isinstance(value_node, ScalarNode)
             and value_node.tag == "tag:yaml.org,2002:str"
             and value_node.style is None
         ):
-            value_node.style = self.config.quote_representation
+            value_node.style = quote_representation
 
 
 YamlfixRepresenter.add_representer(type(None), YamlfixRepresenter.represent_none)
@@ -346,13 +379,9 @@ class SourceCodeFixer:
         log.debug("Running source code fixers...")
 
         fixers = [
-            self._fix_truthy_strings,
-            self._fix_jinja_variables,
+            self._fix_lines_before_ruamel,
             self._ruamel_yaml_fixer,
-            self._restore_truthy_strings,
-            self._restore_jinja_variables,
-            self._restore_double_exclamations,
-            self._fix_comments,
+            self._fix_lines_after_ruamel,
             self._fix_flow_style_lists,
             self._fix_whitelines,
             self._fix_top_level_lists,
@@ -364,6 +393,72 @@ class SourceCodeFixer:
 
         return source_code
 
+    def _fix_lines_before_ruamel(self, source_code: str) -> str:
+        """Run the line fixers that prepare the source code for ruyaml.
+
+        All of them work on one line at a time, so they share a single pass over the
+        source code lines.
+
+        Args:
+            source_code: Source code to be corrected.
+
+        Returns:
+            Corrected source code.
+        """
+        log.debug("Fixing truthy strings...")
+        log.debug("Fixing jinja2 variables...")
+        fix_jinja = "{{" in source_code
+        fixed_source_lines: List[str] = []
+
+        for line in source_code.splitlines():
+            line = self._fix_truthy_strings(line)
+            if fix_jinja:
+                line = self._fix_jinja_variables(line)
+            fixed_source_lines.append(line)
+
+        # The fixers have always dropped up to two trailing newlines, keep doing it as
+        # they decide how ruyaml chomps a block scalar at the end of the document.
+        if len(fixed_source_lines) > 1 and fixed_source_lines[-1] == "":
+            fixed_source_lines.pop()
+
+        return "\n".join(fixed_source_lines)
+
+    def _fix_lines_after_ruamel(self, source_code: str) -> str:
+        """Run the line fixers that clean up the source code generated by ruyaml.
+
+        All of them work on one line at a time, so they share a single pass over the
+        source code lines.
+
+        Args:
+            source_code: Source code to be corrected.
+
+        Returns:
+            Corrected source code.
+        """
+        source_code = self._restore_double_exclamations(source_code)
+
+        log.debug("Restoring truthy strings...")
+        log.debug("Restoring jinja2 variables...")
+        log.debug("Fixing comments...")
+        config = self.config
+        comment_start = " " * config.comments_min_spaces_from_content + "#"
+        fix_comments = (
+            config.comments_require_starting_space
+            or config.comments_min_spaces_from_content > 1
+        )
+        restore_jinja = "{{" in source_code
+        fixed_source_lines: List[str] = []
+
+        for line in source_code.splitlines():
+            line = self._restore_truthy_strings(line)
+            if restore_jinja:
+                line = self._restore_jinja_variables(line)
+            if fix_comments and "#" in line:
+                line = self._fix_comments(line, comment_start)
+            fixed_source_lines.append(line)
+
+        return "\n".join(fixed_source_lines)
+
     def _ruamel_yaml_fixer(self, source_code: str) -> str:
         """Run Ruamel's yaml fixer.
 
@@ -380,6 +475,8 @@ class SourceCodeFixer:
         string_stream = StringIO()
         for source_dict in source_dicts:
             self.yaml.dump(source_dict, string_stream)
+        # Source code without documents, like the comment only ones, is left as is
+        if string_stream.tell() > 0:
             source_code = string_stream.getvalue()
         string_stream.close()
 
@@ -416,6 +513,13 @@ class SourceCodeFixer:
             Corrected source code.
         """
         log.debug("Fixing top level lists...")
+        # Most documents don't start with a list, find it out before splitting them
+        first_content_line = _FIRST_CONTENT_LINE_REGEX.search(source_code)
+        if first_content_line and not _LIST_ITEM_REGEX.match(
+            first_content_line.group()
+        ):
+            return source_code
+
         source_lines = source_code.splitlines()
         fixed_source_lines: List[str] = []
         is_top_level_list: Optional[bool] = None
@@ -423,30 +527,26 @@ class SourceCodeFixer:
         indent: str = ""
         for line in source_lines:
             # Skip the heading and first empty lines
-            if re.match(r"^(---|#.*|)$", line):
+            if line in ("", "---") or line.startswith("#"):
                 fixed_source_lines.append(line)
                 continue
 
             # Check if the first valid line is an indented list item
-            if re.match(r"\s*- +.*", line) and is_top_level_list is None:
+            serialized_line = _LIST_ITEM_REGEX.match(line)
+            if serialized_line and is_top_level_list is None:
                 is_top_level_list = True
 
                 # Extract the indentation level
-                serialized_line = re.match(r"(?P<indent>\s*)- +(?P<content>.*)", line)
-                if serialized_line is None:  # pragma: no cover
-                    raise ValueError(
-                        f"Error extracting the indentation of line: {line}"
-                    )
                 indent = serialized_line.groupdict()["indent"]
 
                 # Remove the indentation from the line
-                fixed_source_lines.append(re.sub(rf"^{indent}(.*)", r"\1", line))
+                fixed_source_lines.append(line.removeprefix(indent))
             elif is_top_level_list:
                 # ruyaml doesn't change the indentation of comments
-                if re.match(r"\s*#.*", line):
+                if line.lstrip().startswith("#"):
                     fixed_source_lines.append(line)
                 else:
-                    fixed_source_lines.append(re.sub(rf"^{indent}(.*)", r"\1", line))
+                    fixed_source_lines.append(line.removeprefix(indent))
             else:
                 return source_code
 
@@ -487,12 +587,15 @@ class SourceCodeFixer:
             Corrected source code.
         """
         log.debug("Fixing flow-style lists...")
-        pattern = r"\[(?P<items>.*)(?P<newlines>\n+)]"
+        # The closing bracket can only be misplaced if it starts a line
+        if "\n]" not in source_code:
+            return source_code
+
         replacement = r"[\g<items>]\g<newlines>"
-        return re.sub(pattern, repl=replacement, string=source_code)
+        return _FLOW_STYLE_LIST_REGEX.sub(repl=replacement, string=source_code)
 
     @staticmethod
-    def _fix_truthy_strings(source_code: str) -> str:
+    def _fix_truthy_strings(line: str) -> str:
         """Convert common strings that refer to booleans.
 
         All caps variations of true, yes and on are transformed to true, while false,
@@ -504,38 +607,23 @@ class SourceCodeFixer:
         [More info](https://yamllint.readthedocs.io/en/stable/rules.html#module-yamllint.rules.truthy) # noqa: E501
 
         Args:
-            source_code: Source code to be corrected.
+            line: Line of source code to be corrected.
 
         Returns:
-            Corrected source code.
+            Corrected line.
         """
-        log.debug("Fixing truthy strings...")
-        source_lines = source_code.splitlines()
-        fixed_source_lines: List[str] = []
-
-        for line in source_lines:
-            line_contains_true = re.match(
-                r"(?P<pre_boolean_text>.*(:|-) )(true|yes|on)$", line, re.IGNORECASE
-            )
-            line_contains_false = re.match(
-                r"(?P<pre_boolean_text>.*(:|-) )(false|no|off)$", line, re.IGNORECASE
-            )
+        if not line[-6:].casefold().endswith(_BOOLEAN_STRING_ENDINGS):
+            return line
 
-            if line_contains_true:
-                fixed_source_lines.append(
-                    f"{line_contains_true.groupdict()['pre_boolean_text']}true"
-                )
-            elif line_contains_false:
-                fixed_source_lines.append(
-                    f"{line_contains_false.groupdict()['pre_boolean_text']}false"
-                )
-            else:
-                fixed_source_lines.append(line)
+        line_contains_boolean = _BOOLEAN_STRING_REGEX.match(line)
+        if line_contains_boolean:
+            boolean = "true" if line_contains_boolean.group("true") else "false"
+            return f"{line_contains_boolean.group('pre_boolean_text')}{boolean}"
 
-        return "\n".join(fixed_source_lines)
+        return line
 
     @staticmethod
-    def _restore_truthy_strings(source_code: str) -> str:
+    def _restore_truthy_strings(line: str) -> str:
         """Restore truthy strings to strings.
 
         The Ruyaml parser removes the apostrophes of all the caps variations of
@@ -545,52 +633,41 @@ class SourceCodeFixer:
         meant to be strings. So we're turning them back from booleans to strings.
 
         Args:
-            source_code: Source code to be corrected.
+            line: Line of source code to be corrected.
 
         Returns:
-            Corrected source code.
+            Corrected line.
         """
-        log.debug("Restoring truthy strings...")
-        source_lines = source_code.splitlines()
-        fixed_source_lines: List[str] = []
-
-        for line in source_lines:
-            line_contains_valid_truthy_string = re.match(
-                r"(?P<pre_boolean_text>.*(:|-) )(?P<boolean_text>yes|on|no|off)$",
-                line,
-                re.IGNORECASE,
+        if not line[-4:].casefold().endswith(_TRUTHY_STRING_ENDINGS):
+            return line
+
+        line_contains_valid_truthy_string = _TRUTHY_STRING_REGEX.match(line)
+        if line_contains_valid_truthy_string:
+            return (
+                f"{line_contains_valid_truthy_string.groupdict()['pre_boolean_text']}"
+                f"'{line_contains_valid_truthy_string.groupdict()['boolean_text']}'"
             )
-            if line_contains_valid_truthy_string:
-                fixed_source_lines.append(
-                    f"{line_contains_valid_truthy_string.groupdict()['pre_boolean_text']}"  # noqa: E501
-                    f"'{line_contains_valid_truthy_string.groupdict()['boolean_text']}'"
-                )
-            else:
-                fixed_source_lines.append(line)
 
-        return "\n".join(fixed_source_lines)
+        return line
 
-    def _fix_comments(self, source_code: str) -> str:
-        log.debug("Fixing comments...")
+    def _fix_comments(self, line: str, comment_start: str) -> str:
         config = self.config
-        comment_start = " " * config.comments_min_spaces_from_content + "#"
 
-        fixed_source_lines = []
-
-        for line in source_code.splitlines():
-            # Comment at the start of the line
-            if config.comments_require_starting_space and re.search(r"(^|\s)#\w", line):
-                line = line.replace("#", "# ")
-            # Comment in the middle of the line, but it's not part of a string
-            if (
-                config.comments_min_spaces_from_content > 1
-                and " #" in line
-                and line[-1] not in ["'", '"']
-            ):
-                line = re.sub(r"(.+\S)(\s+?)#", rf"\1{comment_start}", line)
-            fixed_source_lines.append(line)
+        # Comment at the start of the line
+        if (
+            config.comments_require_starting_space
+            and _COMMENT_WITHOUT_SPACE_REGEX.search(line)
+        ):
+            line = line.replace("#", "# ")
+        # Comment in the middle of the line, but it's not part of a string
+        if (
+            config.comments_min_spaces_from_content > 1
+            and " #" in line
+            and not line.endswith(("'", '"'))
+        ):
+            line = _INLINE_COMMENT_REGEX.sub(rf"\1{comment_start}", line)
 
-        return "\n".join(fixed_source_lines)
+        return line
 
     def _fix_whitelines(self, source_code: str) -> str:
         """Fixes number of consecutive whitelines.
@@ -612,26 +689,24 @@ class SourceCodeFixer:
         n_whitelines = config.whitelines
         n_whitelines_from_content = config.comments_whitelines
 
-        re_whitelines_with_comments = "\n\n+[\t ]{0,}[#]"
-        re_whitelines_with_no_comments = "\n\n+[\t ]{0,}[^#\n\t ]"
-
         adjust_whitelines = partial(self._replace_whitelines, n_whitelines=n_whitelines)
         replace_by_n_whitelines = partial(
             self._replace_whitelines,
             n_whitelines=n_whitelines_from_content,
         )
 
-        source_code = re.sub(
-            pattern=re_whitelines_with_no_comments,
-            repl=adjust_whitelines,
-            string=source_code,
-        )
+        # Both whitelines patterns start with an empty line
+        if "\n\n" in source_code:
+            source_code = _WHITELINES_WITHOUT_COMMENTS_REGEX.sub(
+                repl=adjust_whitelines,
+                string=source_code,
+            )
         source_code = self._fix_section_whitelines(source_code)
-        source_code = re.sub(
-            pattern=re_whitelines_with_comments,
-            repl=replace_by_n_whitelines,
-            string=source_code,
-        )
+        if "\n\n" in source_code:
+            source_code = _WHITELINES_WITH_COMMENTS_REGEX.sub(
+                repl=replace_by_n_whitelines,
+                string=source_code,
+            )
 
         return source_code
 
@@ -657,14 +732,11 @@ class SourceCodeFixer:
         return adjusted_matched_str
 
     def _fix_section_whitelines(self, source_code: str) -> str:
-        re_section = "\n*(^#.*\n)*\n*^[^ ].*:\n(\n|(^  .*))+\n*"
-
-        # Match the first --- or start of the string \A
-        # See: https://docs.python.org/3.9/library/re.html#regular-expression-syntax
-        re_beginning_section = f"(?P<b>(?:---\n|\\A){re_section})"
-        re_normal_section = f"(?P<s>{re_section})"
-        re_full = f"{re_beginning_section}|{re_normal_section}"
-        pattern = re.compile(re_full, flags=re.MULTILINE)
+        # Sections start with a key line that ends with a colon
+        if ":\n" not in source_code:
+            return source_code
+
+        pattern = _SECTION_WHITELINES_REGEX
         n_whitelines = self.config.whitelines
         n_section_whitelines = self.config.section_whitelines
 
@@ -693,10 +765,7 @@ class SourceCodeFixer:
             return section + "\n" * (whitelines + 1)
 
         before_fixed = pattern.sub(repl=_fix_before_section, string=source_code)
-        after_fixed = pattern.sub(repl=_fix_after_section, string=before_fixed)
-        while after_fixed[-2:] == "\n\n":
-            after_fixed = after_fixed[:-1]
-        return after_fixed
+        return pattern.sub(repl=_fix_after_section, string=before_fixed)
 
     @staticmethod
     def _restore_double_exclamations(source_code: str) -> str:
@@ -706,15 +775,7 @@ class SourceCodeFixer:
         some programs.
         """
         log.debug("Restoring double exclamations...")
-        fixed_source_lines = []
-        double_exclamation = re.compile(r"!%21")
-
-        for line in source_code.splitlines():
-            if double_exclamation.search(line):
-                line = line.replace(r"!%21", "!!")
-            fixed_source_lines.append(line)
-
-        return "\n".join(fixed_source_lines)
+        return source_code.replace("!%21", "!!")
 
     @staticmethod
     def _add_newline_at_end_of_file(source_code: str) -> str:
@@ -729,30 +790,27 @@ class SourceCodeFixer:
         return source_code.rstrip() + "\n"
 
     @staticmethod
-    def _fix_jinja_variables(source_code: str) -> str:
+    def _fix_jinja_variables(line: str) -> str:
         """Remove spaces between jinja variables.
 
         So that they are not split in many lines by ruyaml
 
         Args:
-            source_code: Source code to be corrected.
+            line: Line of source code to be corrected.
 
         Returns:
-            Corrected source code.
+            Corrected line.
         """
-        log.debug("Fixing jinja2 variables...")
-        source_lines = source_code.splitlines()
-        fixed_source_lines: List[str] = []
-
-        for line in source_lines:
-            line_contains_jinja2_variable = re.search(r"{{.*}}", line)
+        if SourceCodeFixer._contains_jinja_variable(line):
+            line = SourceCodeFixer._encode_jinja2_line(line)
 
-            if line_contains_jinja2_variable:
-                line = SourceCodeFixer._encode_jinja2_line(line)
+        return line
 
-            fixed_source_lines.append(line)
-
-        return "\n".join(fixed_source_lines)
+    @staticmethod
+    def _contains_jinja_variable(line: str) -> bool:
+        """Check if there is a {{ followed by a }} in the line."""
+        variable_start = line.find("{{")
+        return variable_start != -1 and line.find("}}", variable_start + 2) != -1
 
     @staticmethod
     def _encode_jinja2_line(line: str) -> str:
@@ -765,11 +823,11 @@ class SourceCodeFixer:
         variable_terms: List[str] = []
 
         for word in line.split(" "):
-            if re.search("}}", word):
+            if "}}" in word:
                 variable_terms.append(word)
                 new_line.append("★".join(variable_terms))
                 variable_terms = []
-            elif re.search("{{", word) or len(variable_terms) > 0:
+            elif "{{" in word or variable_terms:
                 variable_terms.append(word)
             else:
                 new_line.append(word)
@@ -777,21 +835,13 @@ class SourceCodeFixer:
         return " ".join(new_line)
 
     @staticmethod
-    def _restore_jinja_variables(source_code: str) -> str:
+    def _restore_jinja_variables(line: str) -> str:
         """Restore the jinja2 variables to their original state.
 
         Remove the encoding introduced by _fix_jinja_variables to prevent ruyaml
         to split the variables.
         """
-        log.debug("Restoring jinja2 variables...")
-        fixed_source_lines = []
-
-        for line in source_code.splitlines():
-            line_contains_jinja2_variable = re.search(r"{{.*}}", line)
-
-            if line_contains_jinja2_variable:
-                line = line.replace("★", " ")
+        if SourceCodeFixer._contains_jinja_variable(line):
+            line = line.replace("★", " ")
 
-            fixed_source_lines.append(line)
-
-        return "\n".join(fixed_source_lines)
+        return line
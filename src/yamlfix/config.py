@@ -35,8 +35,7 @@ def configure_yamlfix(
         for override_key, override_val in additional_config.items():
             config_dict[override_key] = override_val
 
-    config.validate()
-    config_dict = config.values
+    config_dict = YamlfixConfig(**config_dict).model_dump()
 
     for config_key, config_val in config_dict.items():
         setattr(yamlfix_config, config_key, config_val)
@@ -40,11 +40,22 @@ class ConsoleColorFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log records as a colored plus sign followed by the log message."""
-        color = self.colors.get(record.levelno, ANSIFGColorCode.RESET)
-        self._style._fmt = f"[\033[{color.value}m+\033[0m] %(message)s"  # noqa: W0212
+        self._style = _LEVEL_STYLES.get(record.levelno, _DEFAULT_STYLE)
         return super().format(record)
 
 
+def _colored_style(color: ANSIFGColorCode) -> logging.PercentStyle:
+    return logging.PercentStyle(f"[\033[{color.value}m+\033[0m] %(message)s")
+
+
+# Styles of each log level, built once and shared by all the formatters
+_LEVEL_STYLES = {
+    level: _colored_style(color)
+    for level, color in ConsoleColorFormatter.colors.items()
+}
+_DEFAULT_STYLE = _colored_style(ANSIFGColorCode.RESET)
+
+
 def load_logger(verbose: int = 0) -> None:
     """Configure the Logging logger.
 
@@ -53,5 +64,8 @@ def load_logger(verbose: int = 0) -> None:
     """
     log_level = logging.INFO - verbose * 5
     logging.basicConfig(stream=sys.stderr, level=log_level)
+    formatter = ConsoleColorFormatter()
     for handler in logging.getLogger().handlers:
-        handler.setFormatter(ConsoleColorFormatter())
+        # Handlers configured by a previous call already use the formatter
+        if not isinstance(handler.formatter, ConsoleColorFormatter):
+            handler.setFormatter(formatter)
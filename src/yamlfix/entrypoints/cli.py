@@ -3,36 +3,94 @@
 import logging
 import os
 import sys
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import click
 from _io import TextIOWrapper
 
-from yamlfix import services, version
-from yamlfix.config import configure_yamlfix
+from yamlfix import version
 from yamlfix.entrypoints import load_logger
-from yamlfix.model import YamlfixConfig
 
 log = logging.getLogger(__name__)
 
 
-def _matches_any_glob(
-    file_to_test: Path, dir_: Path, globs: Optional[List[str]]
-) -> bool:
-    return any(file_to_test in dir_.glob(glob) for glob in (globs or []))
+def _unique_paths(files: Tuple[str, ...]) -> List[str]:
+    """Remove the arguments that resolve to the path of a previous one.
+
+    Shell expansions and different spellings like a.yaml and ./a.yaml can repeat
+    files, fix each of them only once.
+    """
+    unique_files: Dict[str, str] = {}
+    for file in files:
+        unique_files.setdefault(os.path.realpath(file), file)
+    return list(unique_files.values())
+
+
+def _glob_all(dir_: Path, globs: Optional[List[str]]) -> Set[Path]:
+    return {file for glob in (globs or []) for file in dir_.glob(glob)}
 
 
 def _find_all_yaml_files(
     dir_: Path, include_globs: Optional[List[str]], exclude_globs: Optional[List[str]]
 ) -> List[Path]:
-    files = [dir_.rglob(glob) for glob in (include_globs or [])]
-    return [
-        file
-        for list_ in files
-        for file in list_
-        if not _matches_any_glob(file, dir_, exclude_globs) and os.path.isfile(file)
-    ]
+    # Glob the excluded files once instead of once for each included file
+    excluded_files = _glob_all(dir_, exclude_globs)
+    # Files matched by more than one include glob are only fixed once
+    files = dict.fromkeys(
+        file for matches in _rglob_files(dir_, include_globs or []) for file in matches
+    )
+    return [file for file in files if file not in excluded_files]
+
+
+def _rglob_files(dir_: Path, globs: List[str]) -> List[List[Path]]:
+    """Find the files under dir_ that match each glob, like Path.rglob does.
+
+    Globs that only match file names are resolved together in a single walk of the
+    tree with os.scandir, whose entries know if they are files or directories
+    without an extra stat call.
+
+    Returns:
+        The files matched by each glob, in the order of the globs.
+    """
+    matches: List[List[Path]] = [[] for _ in globs]
+    name_globs: List[Tuple[str, List[Path]]] = []
+
+    for glob, glob_matches in zip(globs, matches):
+        if "/" in glob or os.sep in glob or "**" in glob:
+            glob_matches.extend(file for file in dir_.rglob(glob) if file.is_file())
+        else:
+            name_globs.append((glob, glob_matches))
+
+    if name_globs:
+        _walk_files(dir_, name_globs)
+    return matches
+
+
+def _walk_files(dir_: Path, name_globs: List[Tuple[str, List[Path]]]) -> None:
+    """Add the files under dir_ to the matches of the name globs they match.
+
+    Each directory adds its files before the ones of its subdirectories, which
+    keeps the order of Path.rglob for every glob.
+    """
+    try:
+        with os.scandir(dir_) as entries_iterator:
+            entries = list(entries_iterator)
+    except OSError:
+        return
+
+    for entry in entries:
+        glob_matches = [
+            matches for glob, matches in name_globs if fnmatch(entry.name, glob)
+        ]
+        if glob_matches and entry.is_file():
+            file = Path(entry.path)
+            for matches in glob_matches:
+                matches.append(file)
+    for entry in entries:
+        if entry.is_dir() and not entry.is_symlink():
+            _walk_files(Path(entry.path), name_globs)
 
 
 @click.command()
@@ -74,6 +132,14 @@ def _find_all_yaml_files(
         "unless they are also excluded. Default to '*.yaml' and '*.yml'."
     ),
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of processes to fix the files with, 0 to use all the CPUs. "
+    "Default to 1.",
+)
 @click.argument("files", type=str, required=True, nargs=-1)
 def cli(  # pylint: disable=too-many-arguments
     files: Tuple[str],
@@ -83,6 +149,7 @@ def cli(  # pylint: disable=too-many-arguments
     include: Optional[List[str]],
     exclude: Optional[List[str]],
     env_prefix: str,
+    jobs: int,
 ) -> None:
     """Corrects the source code of the specified files.
 
@@ -96,14 +163,16 @@ def cli(  # pylint: disable=too-many-arguments
             raise ValueError("Cannot specify '-' and other files at the same time.")
         files_to_fix = [sys.stdin]
     else:
-        paths = [Path(file) for file in files]
-        real_files = []
-        for provided_file in paths:
+        paths_to_fix: List[str] = []
+        for provided_file in map(Path, _unique_paths(files)):
             if provided_file.is_dir():
-                real_files.extend(_find_all_yaml_files(provided_file, include, exclude))
+                paths_to_fix.extend(
+                    str(file)
+                    for file in _find_all_yaml_files(provided_file, include, exclude)
+                )
             else:
-                real_files.append(provided_file)
-        files_to_fix = [str(file) for file in real_files]
+                paths_to_fix.append(str(provided_file))
+        files_to_fix = paths_to_fix
     if not files_to_fix:
         log.warning("No YAML files found!")
         sys.exit(0)
@@ -111,12 +180,22 @@ def cli(  # pylint: disable=too-many-arguments
     load_logger(verbose)
     log.info("YamlFix: %s files", "Checking" if check else "Fixing")
 
+    # Loading ruyaml and pydantic takes most of the start up time, don't do it for
+    # --help or when there is nothing to fix
+    # pylint: disable=import-outside-toplevel
+    from yamlfix import services
+    from yamlfix.config import configure_yamlfix
+    from yamlfix.model import YamlfixConfig
+
     config = YamlfixConfig()
     configure_yamlfix(
         config, config_file, _parse_env_vars_as_yamlfix_config(env_prefix.lower())
     )
 
-    fixed_code, changed = services.fix_files(files_to_fix, check, config)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    fixed_code, changed = services.fix_files(files_to_fix, check, config, jobs)
 
     if fixed_code is not None:
         print(fixed_code, end="")
@@ -126,14 +205,17 @@ def cli(  # pylint: disable=too-many-arguments
 
 
 def _parse_env_vars_as_yamlfix_config(env_prefix: str) -> Dict[str, str]:
-    prefix_length = len(env_prefix) + 1  # prefix with underscore / delimiter (+1)
+    env_prefix_length = len(env_prefix)
+    prefix_length = env_prefix_length + 1  # prefix with underscore / delimiter (+1)
     additional_config: Dict[str, str] = {}
 
     for env_key, env_val in os.environ.items():
-        sanitized_key = env_key.lower()
-
-        if sanitized_key.startswith(env_prefix) and len(sanitized_key) > prefix_length:
-            additional_config[sanitized_key[prefix_length:]] = env_val
+        # Most variables don't start with the prefix, don't lowercase them whole
+        if (
+            len(env_key) > prefix_length
+            and env_key[:env_prefix_length].lower() == env_prefix
+        ):
+            additional_config[env_key[prefix_length:].lower()] = env_val
 
     return additional_config
 
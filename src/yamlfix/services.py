@@ -5,8 +5,11 @@ and handlers to achieve the program's purpose.
 """
 
 import logging
+import os
+import threading
 import warnings
-from typing import List, Optional, Tuple, Union, overload
+from functools import partial
+from typing import Any, Iterator, List, Optional, Set, Tuple, Union, overload
 
 from _io import TextIOWrapper
 
@@ -17,6 +20,13 @@ log = logging.getLogger(__name__)
 
 Files = Union[Tuple[TextIOWrapper], List[str]]
 
+# Source code fixer of the worker processes, built once by _init_worker
+_worker_fixer: Optional[SourceCodeFixer] = None
+
+# Last source code fixer built by fix_code in each thread, as ruyaml is not thread
+# safe, together with the configuration values it was built with
+_thread_fixers = threading.local()
+
 
 @overload
 def fix_files(files: Files) -> Optional[str]: ...  # pragma: no cover
@@ -30,12 +40,18 @@ def fix_files(
 
 @overload
 def fix_files(
-    files: Files, dry_run: Optional[bool], config: Optional[YamlfixConfig]
+    files: Files,
+    dry_run: Optional[bool],
+    config: Optional[YamlfixConfig],
+    jobs: int = ...,
 ) -> Tuple[Optional[str], bool]: ...  # pragma: no cover
 
 
 def fix_files(  # pylint: disable=too-many-branches
-    files: Files, dry_run: Optional[bool] = None, config: Optional[YamlfixConfig] = None
+    files: Files,
+    dry_run: Optional[bool] = None,
+    config: Optional[YamlfixConfig] = None,
+    jobs: int = 1,
 ) -> Union[Optional[str], Tuple[Optional[str], bool]]:  # noqa: TAE002
     """Fix the yaml source code of a list of files.
 
@@ -45,6 +61,8 @@ def fix_files(  # pylint: disable=too-many-branches
         files: List of files to fix.
         dry_run: Whether to write changes or not.
         config: Small set of user provided configuration options for yamlfix.
+        jobs: Number of processes to fix the files with. stdin and already open
+            files are always fixed in the current process.
 
     Returns:
         A tuple with the following items:
@@ -69,43 +87,57 @@ def fix_files(  # pylint: disable=too-many-branches
 
     total_fixed = 0
 
-    for file_ in files:
-        if isinstance(file_, str):
-            with open(file_, "r", encoding="utf-8") as file_descriptor:
-                source = file_descriptor.read()
-                file_name = file_
-        else:
-            source = file_.read()
-            file_name = file_.name
-
-        log.debug("Fixing file %s...", file_name)
-        fixed_source = fix_code(source, config)
-
-        if fixed_source != source:
-            changed = True
-            if dry_run:
-                log.info("Would fix %s", file_name)
-            else:
-                log.info("Fixed %s", file_name)
-                total_fixed += 1
-        else:
-            log.log(15, "%s is already well formatted", file_name)
-
-        if file_name == "<stdin>":
-            if dry_run is None:
-                return fixed_source
-            return fixed_source, changed
-
-        if fixed_source != source:
-            if dry_run:
-                continue
+    serial_files: Files = files
+    if jobs > 1 and len(files) > 1 and all(isinstance(file_, str) for file_ in files):
+        # Two processes writing the same file would race, so the paths to an already
+        # queued file are fixed once the pool is done
+        parallel_files, serial_files = _split_repeated_files(files)
+        for file_name, file_changed in _fix_paths_in_parallel(
+            parallel_files, dry_run, config, jobs
+        ):
+            log.debug("Fixing file %s...", file_name)
+            _log_fix_result(file_name, file_changed, dry_run)
+            if file_changed:
+                changed = True
+                if not dry_run:
+                    total_fixed += 1
+
+    if serial_files:
+        # Build the ruyaml parser once and reuse it for all the files
+        fixer = SourceCodeFixer(yaml=Yaml(config=config), config=config)
+
+        for file_ in serial_files:
             if isinstance(file_, str):
-                with open(file_, "w", encoding="utf-8") as file_descriptor:
-                    file_descriptor.write(fixed_source)
+                source = _read_file(file_)
+                file_name = file_
             else:
-                file_.seek(0)
-                file_.write(fixed_source)
-                file_.truncate()
+                source = file_.read()
+                file_name = file_.name
+
+            log.debug("Fixing file %s...", file_name)
+            fixed_source = _fix_code(source, fixer)
+            file_changed = fixed_source != source
+
+            _log_fix_result(file_name, file_changed, dry_run)
+            if file_changed:
+                changed = True
+                if not dry_run:
+                    total_fixed += 1
+
+            if file_name == "<stdin>":
+                if dry_run is None:
+                    return fixed_source
+                return fixed_source, changed
+
+            if file_changed:
+                if dry_run:
+                    continue
+                if isinstance(file_, str):
+                    _write_file(file_, fixed_source)
+                else:
+                    file_.seek(0)
+                    file_.write(fixed_source)
+                    file_.truncate()
     log.info(
         "Checked %d files: %d fixed, %d left unchanged",
         len(files),
@@ -119,6 +151,149 @@ def fix_files(  # pylint: disable=too-many-branches
     return None, changed
 
 
+def _read_file(file_name: str) -> str:
+    """Read the content of a file as open(file_name, "r") does, but faster.
+
+    Decoding the whole file at once is cheaper than going through a text wrapper,
+    the newlines are then translated as the text mode would do.
+    """
+    with open(file_name, "rb") as file_descriptor:
+        source = file_descriptor.read().decode("utf-8")
+
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+
+def _write_file(file_name: str, content: str) -> None:
+    """Replace the content of a file in place.
+
+    The file keeps its inode, so its owner, permissions, hard links and extended
+    attributes are left as they are. The text wrapper hands the encoded content to
+    the operating system in a single write.
+    """
+    with open(file_name, "w", encoding="utf-8") as file_descriptor:
+        file_descriptor.write(content)
+
+
+def _log_fix_result(
+    file_name: str, file_changed: bool, dry_run: Optional[bool]
+) -> None:
+    """Log whether the file needed to be fixed."""
+    if not file_changed:
+        log.log(15, "%s is already well formatted", file_name)
+    elif dry_run:
+        log.info("Would fix %s", file_name)
+    else:
+        log.info("Fixed %s", file_name)
+
+
+def _split_repeated_files(files: List[str]) -> Tuple[List[str], List[str]]:
+    """Split the paths in the first one to each file and the ones that repeat it.
+
+    Symbolic links, hard links and different spellings of a path are detected
+    comparing the device and inode of the files.
+
+    Returns:
+        A tuple with the first path to each file and the rest of them.
+    """
+    seen_files: Set[Tuple[int, int]] = set()
+    unique_files: List[str] = []
+    repeated_files: List[str] = []
+
+    for file_name in files:
+        try:
+            file_stat = os.stat(file_name)
+        except OSError:
+            # Let the worker raise the error when it reads the file
+            unique_files.append(file_name)
+            continue
+        file_id = (file_stat.st_dev, file_stat.st_ino)
+        if file_id in seen_files:
+            repeated_files.append(file_name)
+        else:
+            seen_files.add(file_id)
+            unique_files.append(file_name)
+
+    return unique_files, repeated_files
+
+
+def _fix_paths_in_parallel(
+    files: List[str],
+    dry_run: Optional[bool],
+    config: Optional[YamlfixConfig],
+    jobs: int,
+) -> Iterator[Tuple[str, bool]]:
+    """Fix the files in a pool of processes.
+
+    The results are yielded in the order of the files, so that they are logged by
+    the current process.
+
+    Args:
+        files: Paths of the files to fix.
+        dry_run: Whether to write changes or not.
+        config: Small set of user provided configuration options for yamlfix.
+        jobs: Number of processes to fix the files with.
+
+    Returns:
+        An iterator of the file names and whether they needed to be fixed.
+    """
+    # Loading multiprocessing slows down the start up of runs that use a single job
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        ProcessPoolExecutor,
+    )
+
+    # Don't start processes that wouldn't have any file to fix
+    jobs = min(jobs, len(files))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        results = executor.map(
+            partial(_fix_path_in_worker, dry_run=dry_run),
+            files,
+            chunksize=max(1, len(files) // (jobs * 4)),
+        )
+        try:
+            yield from zip(files, results)
+        except BaseException:
+            # Stop like the serial path does, instead of fixing the queued files
+            # without logging them
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def _init_worker(config: Optional[YamlfixConfig]) -> None:
+    """Build the source code fixer the worker process uses for all its files."""
+    global _worker_fixer  # noqa: W0603  # pylint: disable=global-statement
+    _worker_fixer = SourceCodeFixer(yaml=Yaml(config=config), config=config)
+
+
+def _fix_path_in_worker(file_name: str, dry_run: Optional[bool]) -> bool:
+    """Fix a file with the fixer of the worker process.
+
+    Returns:
+        Whether the file needed to be fixed.
+    """
+    if _worker_fixer is None:  # pragma: no cover
+        raise ValueError("The worker process has not been initialized")
+
+    source = _read_file(file_name)
+
+    try:
+        fixed_source = _fix_code(source, _worker_fixer)
+    except BaseException:
+        # ruyaml keeps the state of the failed document, like its anchors, don't let
+        # it reach the next files of the worker
+        _init_worker(_worker_fixer.config)
+        raise
+    if fixed_source == source:
+        return False
+
+    if not dry_run:
+        _write_file(file_name, fixed_source)
+    return True
+
+
 def fix_code(source_code: str, config: Optional[YamlfixConfig] = None) -> str:
     """Fix yaml source code to correct the format.
 
@@ -133,6 +308,57 @@ def fix_code(source_code: str, config: Optional[YamlfixConfig] = None) -> str:
         source_code: Source code to be corrected.
         config: Small set of user provided configuration options for yamlfix.
 
+    Returns:
+        Corrected source code.
+    """
+    fixer = _get_fixer(config)
+    try:
+        return _fix_code(source_code, fixer)
+    except BaseException:
+        # ruyaml keeps the state of the failed document, like its anchors, don't let
+        # it reach the next call
+        del _thread_fixers.fixer
+        raise
+
+
+def _get_fixer(config: Optional[YamlfixConfig]) -> SourceCodeFixer:
+    """Get a source code fixer for the configuration.
+
+    Building the ruyaml parser is expensive, so the fixer is reused while fix_code is
+    called with the same configuration values.
+
+    Args:
+        config: Small set of user provided configuration options for yamlfix.
+
+    Returns:
+        Source code fixer configured with the values of config.
+    """
+    config_values: Optional[Tuple[Tuple[str, Any], ...]] = None
+    if config is not None:
+        config_values = tuple(config.__dict__.items())
+
+    cached_fixer: Optional[Tuple[Any, SourceCodeFixer]] = getattr(
+        _thread_fixers, "fixer", None
+    )
+    if cached_fixer is not None and cached_fixer[0] == config_values:
+        return cached_fixer[1]
+
+    # Build it with a copy so that later changes of config don't reach the fixer
+    if config is not None:
+        config = config.model_copy()
+    fixer = SourceCodeFixer(yaml=Yaml(config=config), config=config)
+    _thread_fixers.fixer = (config_values, fixer)
+
+    return fixer
+
+
+def _fix_code(source_code: str, fixer: SourceCodeFixer) -> str:
+    """Fix yaml source code with an already configured source code fixer.
+
+    Args:
+        source_code: Source code to be corrected.
+        fixer: Source code fixer to use for the correction.
+
     Returns:
         Corrected source code.
     """
@@ -155,9 +381,6 @@ def fix_code(source_code: str, config: Optional[YamlfixConfig] = None) -> str:
     else:
         jinja2 = ""
 
-    yaml = Yaml(config=config)
-    fixer = SourceCodeFixer(yaml=yaml, config=config)
-
     source_code = fixer.fix(source_code=source_code)
 
     return jinja2 + shebang + source_code
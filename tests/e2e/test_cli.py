@@ -3,16 +3,21 @@
 import logging
 import os
 import re
+import sys
 from itertools import product
 from pathlib import Path
 from textwrap import dedent
+from typing import List, Tuple
 
 import py  # type: ignore
 import pytest
 from _pytest.logging import LogCaptureFixture
 from click.testing import CliRunner
 
+from yamlfix import services
+from yamlfix.__main__ import main
 from yamlfix.entrypoints.cli import cli
+from yamlfix.model import YamlfixConfig
 from yamlfix.version import __version__
 
 
@@ -32,6 +37,35 @@ def test_version(runner: CliRunner) -> None:
     )
 
 
+def test_console_script_prints_version(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """The console script answers --version without loading the cli."""
+    monkeypatch.setattr(sys, "argv", ["yamlfix", "--version"])
+
+    main()  # act
+
+    assert re.search(
+        rf" *yamlfix: {__version__}\n *Python: .*\n *Platform: .*",
+        capsys.readouterr().out,
+    )
+
+
+def test_console_script_runs_the_cli(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The console script hands the rest of the invocations to the cli."""
+    test_file = tmp_path / "source.yaml"
+    test_file.write_text("program: yamlfix")
+    monkeypatch.setattr(sys, "argv", ["yamlfix", str(test_file)])
+
+    with pytest.raises(SystemExit) as result:
+        main()
+
+    assert result.value.code == 0
+    assert test_file.read_text() == "---\nprogram: yamlfix\n"
+
+
 def test_corrects_one_file(runner: CliRunner, tmp_path: Path) -> None:
     """Correct the source code of a file."""
     test_file = tmp_path / "source.yaml"
@@ -129,6 +163,101 @@ def test_include_exclude_files(runner: CliRunner, tmp_path: Path) -> None:
     assert exclude4.read_text() == init_source
 
 
+def test_include_files_matched_by_many_globs_once(
+    runner: CliRunner, tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    """Files matching more than one include glob are fixed only once."""
+    caplog.set_level(logging.INFO)
+    test_file = tmp_path / "source.yaml"
+    test_file.write_text("program: yamlfix")
+
+    result = runner.invoke(
+        cli, [str(tmp_path), "--include", "*.yaml", "--include", "source.*"]
+    )
+
+    assert result.exit_code == 0
+    assert test_file.read_text() == "---\nprogram: yamlfix\n"
+    assert "Checked 1 files: 1 fixed, 0 left unchanged" in caplog.messages
+
+
+def test_include_files_are_fixed_in_the_order_of_the_globs(
+    runner: CliRunner, tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    """Files are fixed glob by glob, each glob in the order of Path.rglob."""
+    caplog.set_level(logging.INFO)
+    (tmp_path / "sub").mkdir()
+    test_files = [
+        tmp_path / "b.yml",
+        tmp_path / "sub" / "d.yml",
+        tmp_path / "a.yaml",
+        tmp_path / "sub" / "c.yaml",
+    ]
+    for test_file in test_files:
+        test_file.write_text("program: yamlfix")
+
+    result = runner.invoke(
+        cli, [str(tmp_path), "--include", "*.yml", "--include", "*.yaml"]
+    )
+
+    assert result.exit_code == 0
+    assert [
+        message for message in caplog.messages if message.startswith("Fixed ")
+    ] == [f"Fixed {test_file}" for test_file in test_files]
+
+
+def test_repeated_files_are_fixed_once(
+    runner: CliRunner, tmp_path: Path, caplog: LogCaptureFixture
+) -> None:
+    """Files given more than once in the arguments are fixed only once."""
+    caplog.set_level(logging.INFO)
+    test_file = tmp_path / "source.yaml"
+    test_file.write_text("program: yamlfix")
+
+    result = runner.invoke(
+        cli, [str(test_file), str(test_file), f"{tmp_path}/./source.yaml"]
+    )
+
+    assert result.exit_code == 0
+    assert test_file.read_text() == "---\nprogram: yamlfix\n"
+    assert "Checked 1 files: 1 fixed, 0 left unchanged" in caplog.messages
+
+
+def test_jobs_fix_files_in_many_processes(runner: CliRunner, tmp_path: Path) -> None:
+    """Files are fixed in a pool of processes when --jobs is greater than one."""
+    test_files = [tmp_path / "source_1.yaml", tmp_path / "source_2.yaml"]
+    for test_file in test_files:
+        test_file.write_text("program: yamlfix")
+
+    result = runner.invoke(cli, [str(tmp_path), "--jobs", "2"])
+
+    assert result.exit_code == 0
+    for test_file in test_files:
+        assert test_file.read_text() == "---\nprogram: yamlfix\n"
+
+
+def test_jobs_zero_uses_all_the_cpus(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files are fixed with one process for each CPU when --jobs is 0."""
+    test_file = tmp_path / "source.yaml"
+    test_file.write_text("program: yamlfix")
+    monkeypatch.setattr(os, "cpu_count", lambda: 3)
+    jobs_used: List[int] = []
+
+    def fake_fix_files(
+        _files: List[str], _dry_run: bool, _config: YamlfixConfig, jobs: int
+    ) -> Tuple[None, bool]:
+        jobs_used.append(jobs)
+        return None, False
+
+    monkeypatch.setattr(services, "fix_files", fake_fix_files)
+
+    result = runner.invoke(cli, [str(tmp_path), "--jobs", "0"])
+
+    assert result.exit_code == 0
+    assert jobs_used == [3]
+
+
 @pytest.mark.secondary()
 @pytest.mark.parametrize(
     ("verbose", "requires_fixing"), product([0, 1, 2], [True, False])
@@ -413,6 +542,16 @@ def test_std_and_file_error(runner: CliRunner, tmp_path: Path) -> None:
     )
 
 
+def test_std_can_only_be_given_once(runner: CliRunner) -> None:
+    """Repeating - is an error, as stdin can only be read once."""
+    result = runner.invoke(cli, ["-", "-"], input="program: yamlfix")
+
+    assert result.exit_code == 1
+    assert (
+        str(result.exception) == "Cannot specify '-' and other files at the same time."
+    )
+
+
 def test_do_not_read_folders_as_files(runner: CliRunner, tmpdir: py.path.local) -> None:
     """Skips folders that have a .yml or .yaml extension."""
     tmpdir.mkdir("folder.yml")
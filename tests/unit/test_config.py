@@ -0,0 +1,43 @@
+"""Test the configuration of the main program."""
+
+from pathlib import Path
+
+import pytest
+
+from yamlfix.config import configure_yamlfix
+from yamlfix.model import YamlfixConfig
+
+
+def test_configure_yamlfix_rereads_changed_config_files(tmp_path: Path) -> None:
+    """
+    Given: A configuration file that has already been read
+    When: The file is changed and yamlfix is configured again
+    Then: The new values are used
+    """
+    config_file = tmp_path / "yamlfix.toml"
+    config_file.write_text("line_length = 100\n")
+    configure_yamlfix(YamlfixConfig(), [str(config_file)])
+    config_file.write_text("line_length = 120\n")
+    config = YamlfixConfig()
+
+    configure_yamlfix(config, [str(config_file)])  # act
+
+    assert config.line_length == 120
+
+
+def test_configure_yamlfix_reads_config_files_created_later(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Given: yamlfix configured from a directory without configuration files
+    When: A configuration file is created and yamlfix is configured again
+    Then: The values of the new file are used
+    """
+    monkeypatch.chdir(tmp_path)
+    configure_yamlfix(YamlfixConfig())
+    (tmp_path / "pyproject.toml").write_text("[tool.yamlfix]\nline_length = 120\n")
+    config = YamlfixConfig()
+
+    configure_yamlfix(config)  # act
+
+    assert config.line_length == 120
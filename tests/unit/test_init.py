@@ -0,0 +1,28 @@
+"""Test the package entry point."""
+
+import pytest
+
+import yamlfix
+from yamlfix import services
+
+
+def test_package_exposes_the_services_functions() -> None:
+    """
+    Given: The yamlfix package
+    When: The public functions are accessed through it
+    Then: The services implementations are returned
+    """
+    result = (yamlfix.fix_code, yamlfix.fix_files)
+
+    assert result == (services.fix_code, services.fix_files)
+    assert {"fix_code", "fix_files"} <= set(dir(yamlfix))
+
+
+def test_package_raises_error_on_unknown_attributes() -> None:
+    """
+    Given: The yamlfix package
+    When: Accessing an attribute it doesn't define
+    Then: An AttributeError is raised
+    """
+    with pytest.raises(AttributeError, match="has no attribute 'inexistent'"):
+        yamlfix.inexistent  # noqa: B018  # pylint: disable=W0104
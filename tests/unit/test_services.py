@@ -1,13 +1,17 @@
 """Tests the service layer."""
 
 import logging
+import os
+import threading
 from pathlib import Path
 from textwrap import dedent
 from typing import Optional
 
 import pytest
+from ruyaml.composer import ComposerError
+from ruyaml.parser import ParserError
 
-from yamlfix import fix_files
+from yamlfix import fix_files, services
 from yamlfix.model import YamlfixConfig, YamlNodeStyle
 from yamlfix.services import fix_code
 
@@ -58,6 +62,130 @@ class TestFixFiles:
 
         assert test_file.read_text() == fixed_source
 
+    def test_fix_files_can_process_many_files(self, tmp_path: Path) -> None:
+        """
+        Given: Many files to fix, one of them with many documents
+        When: Passing them to fix_files
+        Then: All the files are fixed with the same parser
+        """
+        test_files = [tmp_path / "source_1.yaml", tmp_path / "source_2.yaml"]
+        test_files[0].write_text("program: yamlfix\n---\nitem: 1")
+        test_files[1].write_text("program: yamlfix")
+        fixed_sources = [
+            "---\nprogram: yamlfix\n---\nitem: 1\n",
+            "---\nprogram: yamlfix\n",
+        ]
+
+        fix_files([str(test_file) for test_file in test_files], False)  # act
+
+        assert [test_file.read_text() for test_file in test_files] == fixed_sources
+
+    def test_fix_files_reads_windows_newlines_as_newlines(
+        self, tmp_path: Path
+    ) -> None:
+        """
+        Given: A well formatted file with Windows newlines
+        When: Passing it to fix_files
+        Then: The file is not reported as changed
+        """
+        test_file = tmp_path / "source.yaml"
+        test_file.write_bytes(b"---\r\nprogram: yamlfix\r\n")
+
+        result = fix_files([str(test_file)], True)
+
+        assert result == (None, False)
+
+    def test_fix_files_keeps_permissions_and_links_of_files(
+        self, tmp_path: Path
+    ) -> None:
+        """
+        Given: An executable file to fix with a symbolic and a hard link to it
+        When: Passing the symbolic link to fix_files
+        Then: The file is fixed, and it's still executable and linked
+        """
+        test_file = tmp_path / "source.yaml"
+        test_file.write_text("program: yamlfix")
+        test_file.chmod(0o755)
+        link = tmp_path / "link.yaml"
+        link.symlink_to(test_file)
+        hard_link = tmp_path / "hard_link.yaml"
+        os.link(test_file, hard_link)
+
+        fix_files([str(link)], False)  # act
+
+        assert test_file.read_text() == "---\nprogram: yamlfix\n"
+        assert test_file.stat().st_mode & 0o777 == 0o755
+        assert link.is_symlink()
+        assert hard_link.read_text() == "---\nprogram: yamlfix\n"
+        assert set(tmp_path.iterdir()) == {test_file, link, hard_link}
+
+    def test_fix_files_can_use_many_processes(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """
+        Given: Many files, some of them need to be fixed
+        When: Passing them to fix_files with more than one job
+        Then: The files are fixed and the results are logged by the main process
+        """
+        caplog.set_level(logging.DEBUG)
+        test_files = [tmp_path / f"source_{index}.yaml" for index in range(3)]
+        test_files[0].write_text("program: yamlfix")
+        test_files[1].write_text("---\nprogram: yamlfix\n")
+        test_files[2].write_text("program: yamlfix")
+
+        result = fix_files(
+            [str(test_file) for test_file in test_files], False, None, jobs=2
+        )
+
+        assert result == (None, True)
+        assert all(
+            test_file.read_text() == "---\nprogram: yamlfix\n"
+            for test_file in test_files
+        )
+        assert "Checked 3 files: 2 fixed, 1 left unchanged" in caplog.messages
+        assert all(
+            f"Fixing file {test_file}..." in caplog.messages for test_file in test_files
+        )
+
+    def test_fix_files_fixes_repeated_files_once_with_many_processes(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """
+        Given: A file to fix and a symbolic link to it
+        When: Passing both to fix_files with more than one job
+        Then: The file is fixed by one process and the other path is left unchanged
+        """
+        caplog.set_level(logging.INFO)
+        test_file = tmp_path / "source.yaml"
+        test_file.write_text("program: yamlfix")
+        link = tmp_path / "link.yaml"
+        link.symlink_to(test_file)
+
+        result = fix_files([str(test_file), str(link)], False, None, jobs=2)
+
+        assert result == (None, True)
+        assert test_file.read_text() == "---\nprogram: yamlfix\n"
+        assert "Checked 2 files: 1 fixed, 1 left unchanged" in caplog.messages
+
+    def test_fix_files_stops_many_processes_on_errors(self, tmp_path: Path) -> None:
+        """
+        Given: Many files, the first one can't be parsed and defines an anchor used
+            by the others
+        When: Passing them to fix_files with more than one job
+        Then: The error is raised and no other file gets the anchor of the first one
+        """
+        test_files = [tmp_path / f"source_{index:02}.yaml" for index in range(16)]
+        test_files[0].write_text("a: &x secret\nb: [1,")
+        for index, test_file in enumerate(test_files[1:], start=1):
+            test_file.write_text("c: *x" if index % 2 == 0 else "program: yamlfix")
+
+        with pytest.raises(ParserError):
+            fix_files([str(test_file) for test_file in test_files], False, None, jobs=2)
+
+        assert not any(
+            "secret" in test_file.read_text() for test_file in test_files[1:]
+        )
+
     def test_fix_files_issues_warning(self, tmp_path: Path) -> None:
         """
         Given: A file to fix
@@ -477,9 +605,12 @@ class TestFixCode:
     def test_fix_code_functions_emit_debug_logs(
         self,
         caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Each fixer function should emit a log at the debug level in each run."""
         caplog.set_level(logging.DEBUG)
+        # Build the fixer again instead of reusing the one of a previous test
+        monkeypatch.setattr(services, "_thread_fixers", threading.local())
 
         fix_code("")  # act
 
@@ -502,6 +633,25 @@ class TestFixCode:
         for record in caplog.records:
             assert record.levelname == "DEBUG"
 
+    def test_fix_code_doesnt_reuse_anchors_of_failed_calls(self) -> None:
+        """An alias to an anchor of a document that failed to parse is undefined."""
+        with pytest.raises(ParserError):
+            fix_code("a: &x secret\nb: [1, \n")
+
+        with pytest.raises(ComposerError):
+            fix_code("c: *x\n")
+
+    def test_fix_code_uses_config_changes_between_calls(self) -> None:
+        """Changing the config after fixing code with it should change the result."""
+        source = "project_name: yamlfix\n"
+        config = YamlfixConfig()
+        fix_code(source, config)
+        config.explicit_start = False
+
+        result = fix_code(source, config)
+
+        assert result == source
+
     @pytest.mark.parametrize("whitespace", ["", "\n", "\n\n"])
     def test_fixed_code_has_exactly_one_newline_at_end_of_file(
         self,